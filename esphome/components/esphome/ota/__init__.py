@@ -1,4 +1,4 @@
-import csv
+import functools
 import logging
 from pathlib import Path
 
@@ -51,6 +51,29 @@ esphome = cg.esphome_ns.namespace("esphome")
 ESPHomeOTAComponent = esphome.class_("ESPHomeOTAComponent", OTAComponent)
 
 
+@functools.lru_cache(maxsize=8)
+def _lookup_partition_type(path: str, mtime_ns: int, name: str) -> str | None:
+    """Return the type of partition ``name`` in the table at ``path``.
+
+    Scans the raw bytes in a single pass and stops at the first match; the
+    fixed Name,Type,... schema doesn't need the csv module. Returns None if
+    no partition with that name exists. Results are memoized on
+    (path, mtime_ns, name) so repeated final-validation passes within one
+    esphome run do not re-open and re-scan the file.
+    """
+    needle = name.encode()
+    for line in Path(path).read_bytes().splitlines():
+        stripped = line.lstrip()
+        # Blank lines and comments fail this prefilter along with other names
+        if not stripped.startswith(needle):
+            continue
+        fields = stripped.split(b",", 2)
+        if len(fields) < 2 or fields[0].strip() != needle:
+            continue
+        return fields[1].strip().lower().decode(errors="replace")
+    return None
+
+
 def _validate_ota_helper_partition(full_conf: ConfigType) -> None:
     """Validate and prepare partition table for OTA helper partition feature."""
     # Find OTA helper partition configuration
@@ -82,35 +105,28 @@ def _validate_ota_helper_partition(full_conf: ConfigType) -> None:
                 f"Custom partitions file '{custom_partitions_path}' not found"
             )
 
-        # Parse and validate
-        partition_found = False
+        # Parse and validate; final validation may run several times per
+        # esphome invocation, so the lookup is cached on (path, mtime, name)
         try:
-            with open(partitions_file, "r") as f:
-                reader = csv.DictReader(
-                    filter(lambda row: not row.startswith("#"), f), skipinitialspace=True
-                )
-                for row in reader:
-                    partition_name = row.get("Name", "").strip()
-                    if partition_name == ota_helper_partition:
-                        partition_found = True
-                        # Validate it's an app partition
-                        partition_type = row.get("Type", "").strip().lower()
-                        if partition_type != "app":
-                            raise cv.Invalid(
-                                f"Partition '{ota_helper_partition}' must be of type 'app', got '{partition_type}'"
-                            )
-                        break
-        except Exception as e:
+            mtime_ns = partitions_file.stat().st_mtime_ns
+            partition_type = _lookup_partition_type(
+                str(partitions_file), mtime_ns, ota_helper_partition
+            )
+        except OSError as e:
             raise cv.Invalid(
                 f"Failed to parse custom partitions file '{custom_partitions_path}': {e}"
             ) from e
 
-        if not partition_found:
+        if partition_type is None:
             raise cv.Invalid(
                 f"Custom partitions file '{custom_partitions_path}' does not contain "
                 f"partition named '{ota_helper_partition}'. When using '{CONF_OTA_HELPER_PARTITION}', "
                 f"your custom partition table must include this partition as an 'app' type."
             )
+        if partition_type != "app":
+            raise cv.Invalid(
+                f"Partition '{ota_helper_partition}' must be of type 'app', got '{partition_type}'"
+            )
 
         _LOGGER.info(
             "Using custom partitions.csv with OTA helper partition '%s'",
@@ -153,10 +169,13 @@ main,     app,  ota_0,    0x10000,  {main_size},
 {ota_helper_partition}, app, ota_1, , {helper_size},
 """
 
-    # Write to project directory
+    # Write to project directory, but leave the file untouched if the content
+    # is already identical so build-system timestamp checks don't re-trigger
     partitions_path = Path(CORE.config_dir) / "partitions.csv"
-    with open(partitions_path, "w") as f:
-        f.write(partition_content)
+    new_bytes = partition_content.encode()
+    if partitions_path.exists() and partitions_path.read_bytes() == new_bytes:
+        return
+    partitions_path.write_bytes(new_bytes)
 
     _LOGGER.info(
         "Auto-generated dual-partition table: %s (main=%s, %s=%s)",
@@ -171,46 +190,58 @@ def ota_esphome_final_validate(config):
     full_conf = fv.full_config.get()
     full_ota_conf = full_conf[CONF_OTA]
     new_ota_conf = []
-    merged_ota_esphome_configs_by_port = {}
+    # port -> [configs, version, id_is_manual, has_password, password]
+    # Consistency checks compare against the tracked scalars instead of
+    # re-indexing a merged dict; merging itself is deferred until the end
+    # so each port pays for merge_config only once per extra entry.
+    esphome_configs_by_port: dict = {}
     ports_with_merged_configs = []
     for ota_conf in full_ota_conf:
-        if ota_conf.get(CONF_PLATFORM) == CONF_ESPHOME:
-            if (
-                conf_port := ota_conf.get(CONF_PORT)
-            ) not in merged_ota_esphome_configs_by_port:
-                merged_ota_esphome_configs_by_port[conf_port] = ota_conf
-            else:
-                if merged_ota_esphome_configs_by_port[conf_port][
-                    CONF_VERSION
-                ] != ota_conf.get(CONF_VERSION):
-                    raise cv.Invalid(
-                        f"Found multiple configurations but {CONF_VERSION} is inconsistent"
-                    )
-                if (
-                    merged_ota_esphome_configs_by_port[conf_port][CONF_ID].is_manual
-                    and ota_conf.get(CONF_ID).is_manual
-                ):
-                    raise cv.Invalid(
-                        f"Found multiple configurations but {CONF_ID} is inconsistent"
-                    )
-                if (
-                    CONF_PASSWORD in merged_ota_esphome_configs_by_port[conf_port]
-                    and CONF_PASSWORD in ota_conf
-                    and merged_ota_esphome_configs_by_port[conf_port][CONF_PASSWORD]
-                    != ota_conf.get(CONF_PASSWORD)
-                ):
-                    raise cv.Invalid(
-                        f"Found multiple configurations but {CONF_PASSWORD} is inconsistent"
-                    )
-
-                ports_with_merged_configs.append(conf_port)
-                merged_ota_esphome_configs_by_port[conf_port] = merge_config(
-                    merged_ota_esphome_configs_by_port[conf_port], ota_conf
-                )
-        else:
+        if ota_conf.get(CONF_PLATFORM) != CONF_ESPHOME:
             new_ota_conf.append(ota_conf)
+            continue
+
+        conf_port = ota_conf.get(CONF_PORT)
+        conf_version = ota_conf.get(CONF_VERSION)
+        conf_id_is_manual = ota_conf.get(CONF_ID).is_manual
+        conf_has_password = CONF_PASSWORD in ota_conf
+        conf_password = ota_conf.get(CONF_PASSWORD)
+
+        if (entry := esphome_configs_by_port.get(conf_port)) is None:
+            esphome_configs_by_port[conf_port] = [
+                [ota_conf],
+                conf_version,
+                conf_id_is_manual,
+                conf_has_password,
+                conf_password,
+            ]
+            continue
+
+        if entry[1] != conf_version:
+            raise cv.Invalid(
+                f"Found multiple configurations but {CONF_VERSION} is inconsistent"
+            )
+        if entry[2] and conf_id_is_manual:
+            raise cv.Invalid(
+                f"Found multiple configurations but {CONF_ID} is inconsistent"
+            )
+        if entry[3] and conf_has_password and entry[4] != conf_password:
+            raise cv.Invalid(
+                f"Found multiple configurations but {CONF_PASSWORD} is inconsistent"
+            )
 
-    new_ota_conf.extend(merged_ota_esphome_configs_by_port.values())
+        entry[0].append(ota_conf)
+        # The merged config takes the most recent ID and gains any new password
+        entry[2] = conf_id_is_manual
+        if conf_has_password:
+            entry[3] = True
+            entry[4] = conf_password
+        ports_with_merged_configs.append(conf_port)
+
+    new_ota_conf.extend(
+        functools.reduce(merge_config, entry[0])
+        for entry in esphome_configs_by_port.values()
+    )
 
     full_conf[CONF_OTA] = new_ota_conf
     fv.full_config.set(full_conf)
@@ -9,8 +9,9 @@ Usage:
     python tools/extract_ota_app_partition.py ota-app/.esphome/build/ota-app/.pioenvs/ota-app/firmware.bin ota-app-partition.bin
 """
 
-import sys
 from pathlib import Path
+import shutil
+import sys
 
 
 def extract_partition_binary(firmware_bin: Path, output_bin: Path):
@@ -25,14 +26,14 @@ def extract_partition_binary(firmware_bin: Path, output_bin: Path):
         sys.exit(1)
 
     # For ESP32, the .bin file in build output is already the partition content
-    # (PlatformIO/ESP-IDF outputs app partition binary, not full flash image)
-    with open(firmware_bin, "rb") as f_in:
-        data = f_in.read()
-
-    with open(output_bin, "wb") as f_out:
-        f_out.write(data)
-
-    print(f"Extracted {len(data)} bytes from {firmware_bin} to {output_bin}")
+    # (PlatformIO/ESP-IDF outputs app partition binary, not full flash image).
+    # copyfile streams the data (in-kernel on Linux) instead of holding the
+    # whole firmware image in memory.
+    shutil.copyfile(firmware_bin, output_bin)
+
+    print(
+        f"Extracted {output_bin.stat().st_size} bytes from {firmware_bin} to {output_bin}"
+    )
     print(f"\nTo flash this partition:")
     print(f"  esphome upload main.yaml --device /dev/ttyUSB0 \\")
     print(f"    --ota-helper-bin {output_bin} --ota-helper-offset 0xYOUR_OFFSET")